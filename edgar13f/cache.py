@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Mapping, Optional, Tuple
+
+import orjson
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = Path(os.environ.get("EDGAR13F_CACHE_DIR") or Path.home() / ".cache" / "edgar13f")
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    # Write to a sibling temp file and rename, so concurrent readers never
+    # see a half-written body.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+# An entry is one file: a compact JSON line of validators (etag,
+# last_modified, fetched_at) followed by the raw body. Body and validators are
+# replaced together, so a 304 can never revalidate another writer's body.
+
+def _encode(body: bytes, meta: Dict) -> bytes:
+    return orjson.dumps(meta) + b"\n" + body
+
+
+def load(path: Path) -> Optional[Tuple[bytes, Dict]]:
+    """Return (body, meta) for a cached response, or None on a miss."""
+    try:
+        head, sep, body = path.read_bytes().partition(b"\n")
+        meta = orjson.loads(head)
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not sep or not isinstance(meta, dict):
+        return None
+    return body, meta
+
+
+def store(path: Path, body: bytes, headers: Mapping[str, str]) -> None:
+    """Cache a response body with its validators; failures only cost a refetch."""
+    meta = {
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "fetched_at": time.time(),
+    }
+    try:
+        _atomic_write(path, _encode(body, meta))
+    except OSError as e:
+        log.debug("Could not write cache entry %s: %s", path, e)
+
+
+def touch(path: Path, body: bytes, meta: Dict) -> None:
+    """Mark a cached entry as revalidated (e.g. after a 304)."""
+    try:
+        _atomic_write(path, _encode(body, {**meta, "fetched_at": time.time()}))
+    except OSError as e:
+        log.debug("Could not refresh cache entry %s: %s", path, e)
+
+
+def is_fresh(meta: Dict, ttl: float) -> bool:
+    return time.time() - meta.get("fetched_at", 0.0) < ttl
+
+
+def conditional_headers(meta: Dict) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
@@ -1,15 +1,48 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import re
 import time
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
 
+import aiohttp
+import orjson
 import requests
-from .utils import sec_headers, polite_sleep
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import cache
+from .utils import TokenBucket, sec_headers
 
 log = logging.getLogger(__name__)
 
+# Submissions JSON changes whenever the manager files; archive indexes are
+# effectively immutable once an accession is accepted.
+SUBMISSIONS_TTL_S = 15 * 60.0
+INDEX_TTL_S = 7 * 24 * 3600.0
+TICKERS_TTL_S = 24 * 3600.0
+# How long a winning HTML listing waits for index.json (which is cacheable)
+INDEX_JSON_GRACE_S = 0.5
+
+# Paces every SEC request, sync and async, just under the 10 req/s limit
+_BUCKET = TokenBucket(rate=9.0, capacity=9)
+
+_CIK_RE = re.compile(r"CIK=(\d{1,10})")
+_HREF_RE = re.compile(rb'href="([^"?#]*)', re.I)
+
+# One pooled session for the sync path: keep-alive avoids a fresh TLS
+# handshake per request. Retries are handled by http_get, not urllib3.
+_SESSION = requests.Session()
+_SESSION.headers.update(sec_headers())
+for _prefix in ("https://sec.gov", "https://www.sec.gov", "https://data.sec.gov"):
+    _SESSION.mount(
+        _prefix,
+        HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=0)),
+    )
+
 
 class HTTPError(Exception):
     pass
@@ -20,14 +53,18 @@ def http_get(
     *,
     timeout: float = 15.0,
     retries: int = 3,
-    sleep_s: float = 0.5,
     user_agent: str | None = None,
+    headers: Mapping[str, str] | None = None,
 ) -> requests.Response:
     last_exc: Optional[Exception] = None
+    req_headers = {**sec_headers(user_agent), **headers} if headers else sec_headers(user_agent)
     for attempt in range(1, retries + 1):
         try:
-            resp = requests.get(url, headers=sec_headers(user_agent), timeout=timeout)
+            _BUCKET.acquire()
+            resp = _SESSION.get(url, headers=req_headers, timeout=timeout)
             if resp.status_code in (429, 503):
+                if resp.status_code == 429:
+                    _BUCKET.penalize()
                 wait = min(10.0, attempt * 1.5)
                 log.warning(
                     "Rate-limited or unavailable (%s). Sleeping %.1fs",
@@ -36,8 +73,10 @@ def http_get(
                 )
                 time.sleep(wait)
                 continue
+            if 400 <= resp.status_code < 500:
+                # Client errors (404, 403, ...) won't fix themselves
+                raise HTTPError(f"GET {url} failed: HTTP {resp.status_code}")
             resp.raise_for_status()
-            polite_sleep(sleep_s)
             return resp
         except requests.RequestException as e:
             last_exc = e
@@ -55,22 +94,152 @@ def http_get(
     raise HTTPError(f"GET {url} failed after {retries} attempts: {last_exc}")
 
 
+def open_session(user_agent: str | None = None) -> aiohttp.ClientSession:
+    """
+    Shared async session for the archive probes. Two connections per host keeps
+    parallel probes well under SEC's ~10 req/s fair-access limit.
+    """
+    return aiohttp.ClientSession(
+        headers=sec_headers(user_agent),
+        connector=aiohttp.TCPConnector(limit_per_host=2),
+    )
+
+
+async def http_get_async(
+    session: aiohttp.ClientSession,
+    url: str,
+    *,
+    timeout: float = 15.0,
+    retries: int = 3,
+    headers: Mapping[str, str] | None = None,
+) -> aiohttp.ClientResponse:
+    """
+    Async twin of http_get. The body is read before returning, so callers can
+    use resp.read()/resp.text()/resp.json() after the connection is released.
+    """
+    last_exc: Optional[Exception] = None
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    for attempt in range(1, retries + 1):
+        try:
+            await _BUCKET.acquire_async()
+            async with session.get(url, headers=headers, timeout=client_timeout) as resp:
+                if resp.status in (429, 503):
+                    if resp.status == 429:
+                        _BUCKET.penalize()
+                    wait = min(10.0, attempt * 1.5)
+                    log.warning(
+                        "Rate-limited or unavailable (%s). Sleeping %.1fs",
+                        resp.status,
+                        wait,
+                    )
+                    await asyncio.sleep(wait)
+                    continue
+                if 400 <= resp.status < 500:
+                    # Client errors (404, 403, ...) won't fix themselves
+                    raise HTTPError(f"GET {url} failed: HTTP {resp.status}")
+                resp.raise_for_status()
+                await resp.read()
+            return resp
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            last_exc = e
+            if attempt == retries:
+                break
+            wait = 1.0 * attempt
+            log.warning(
+                "GET failed (attempt %d/%d): %s; retrying in %.1fs",
+                attempt,
+                retries,
+                e,
+                wait,
+            )
+            await asyncio.sleep(wait)
+    raise HTTPError(f"GET {url} failed after {retries} attempts: {last_exc}")
+
+
+# ---- Conditional GETs backed by the on-disk cache ----
+
+def cached_get(
+    url: str, path: Path, *, ttl: float, user_agent: str | None = None
+) -> bytes:
+    """
+    Return the body for url, served from the cache while younger than ttl and
+    revalidated with If-None-Match/If-Modified-Since after that.
+    """
+    entry = cache.load(path)
+    if entry is not None and cache.is_fresh(entry[1], ttl):
+        return entry[0]
+    cond = cache.conditional_headers(entry[1]) if entry is not None else None
+    resp = http_get(url, user_agent=user_agent, headers=cond)
+    if resp.status_code == 304 and entry is not None:
+        cache.touch(path, *entry)
+        return entry[0]
+    cache.store(path, resp.content, resp.headers)
+    return resp.content
+
+
+async def cached_get_async(
+    session: aiohttp.ClientSession,
+    url: str,
+    path: Path,
+    *,
+    ttl: float,
+) -> bytes:
+    entry = cache.load(path)
+    if entry is not None and cache.is_fresh(entry[1], ttl):
+        return entry[0]
+    cond = cache.conditional_headers(entry[1]) if entry is not None else None
+    resp = await http_get_async(session, url, headers=cond)
+    if resp.status == 304 and entry is not None:
+        cache.touch(path, *entry)
+        return entry[0]
+    body = await resp.read()
+    cache.store(path, body, resp.headers)
+    return body
+
+
 def pad_cik(cik: str) -> str:
     return cik.zfill(10)
 
 
+@functools.lru_cache(maxsize=1)
+def _company_name_index(user_agent: str | None = None) -> Dict[str, str]:
+    """Map lowercased company title -> raw CIK from SEC's company_tickers.json."""
+    url = "https://www.sec.gov/files/company_tickers.json"
+    body = cached_get(url, cache.CACHE_DIR / "tickers.json", ttl=TICKERS_TTL_S, user_agent=user_agent)
+    index: Dict[str, str] = {}
+    for entry in orjson.loads(body).values():
+        index.setdefault(entry.get("title", "").lower().strip(), str(entry.get("cik_str", "")))
+    return index
+
+
 def resolve_cik_from_manager_name(name: str, *, user_agent: str | None = None) -> Optional[str]:
     """
-    Resolve a manager name to CIK using SEC company browse (Atom feed).
+    Resolve a manager name to CIK, first via the cached company_tickers.json
+    (exact title, else the shortest title containing the name), then via SEC
+    company browse (Atom feed) when no listed company matches.
     Returns a raw CIK string (no padding) or None if not found.
     """
     import urllib.parse
 
+    query = name.lower().strip()
+    try:
+        index = _company_name_index(user_agent)
+    except Exception as e:
+        log.warning("Company tickers lookup unavailable: %s", e)
+        index = {}
+    cik = index.get(query)
+    if cik is None and query:
+        # Shortest containing title is the closest fit ("apple" -> "apple inc.",
+        # not "pineapple apple holdings corp"); ties go to file order.
+        best = min((title for title in index if query in title), key=len, default=None)
+        cik = index[best] if best is not None else None
+    if cik:
+        return cik
+
     q = urllib.parse.quote(name)
     url = f"https://www.sec.gov/cgi-bin/browse-edgar?company={q}&owner=exclude&action=getcompany&output=atom"
     resp = http_get(url, user_agent=user_agent)
-    text = resp.text
-    m = re.search(r"CIK=(\d{1,10})", text)
+    m = _CIK_RE.search(resp.text)
     if m:
         return m.group(1)
     return None
@@ -78,134 +247,223 @@ def resolve_cik_from_manager_name(name: str, *, user_agent: str | None = None) -
 
 def load_submissions_json(cik: str, *, user_agent: str | None = None) -> Dict[str, Any]:
     url = f"https://data.sec.gov/submissions/CIK{pad_cik(cik)}.json"
-    return http_get(url, user_agent=user_agent).json()
+    path = cache.CACHE_DIR / "submissions" / f"{pad_cik(cik)}.json"
+    return orjson.loads(cached_get(url, path, ttl=SUBMISSIONS_TTL_S, user_agent=user_agent))
 
 
 def latest_13f_accession(
     submissions: Dict[str, Any], *, filing_month: str | None = None
-) -> Optional[Dict[str, str]]:
+) -> Optional[Dict[str, Any]]:
     """
-    Return dict with {accession, filingDate} for latest 13F-HR, optionally filtered by 'YYYY-MM'.
+    Return dict with {accession, filingDate, reportDate, index} for latest 13F-HR,
+    optionally filtered by 'YYYY-MM'. index is the position in the parallel
+    "recent" arrays; reportDate is "" when the feed doesn't carry one.
     """
     recent = submissions.get("filings", {}).get("recent", {})
     forms = recent.get("form", [])
     accs = recent.get("accessionNumber", [])
     dates = recent.get("filingDate", [])
-    for form, acc, dt in zip(forms, accs, dates):
+    report_dates = recent.get("reportDate")
+    if not isinstance(report_dates, list):
+        report_dates = []
+    for i, (form, acc, dt) in enumerate(zip(forms, accs, dates)):
         if form != "13F-HR":
             continue
         if filing_month and not dt.startswith(filing_month):
             continue
-        return {"accession": acc, "filingDate": dt}
+        report_date = report_dates[i] if i < len(report_dates) else ""
+        return {"accession": acc, "filingDate": dt, "reportDate": report_date, "index": i}
     return None
 
 
 # ---- Directory listing helpers (JSON first, then HTML fallback) ----
 
-def index_listing_for_accession(
-    cik_dir: str, accession_nodash: str, *, user_agent: str | None = None
-) -> dict:
+def _listing_from_index_json(j: Dict[str, Any]) -> dict:
+    items = j.get("directory", {}).get("item", [])
+    return {"files": [{"name": it.get("name", "")} for it in items]}
+
+
+def _listing_from_html(body: bytes) -> dict:
     """
-    Return a normalized listing dict: {"files": [{"name": "..."} ...]}
-    Tries JSON first; if missing, parses the HTML index page or directory listing.
+    Leaf filenames linked from an SEC index/directory page. A byte-level href
+    scan covers these simple pages; BeautifulSoup is only the last resort.
     """
-    # Try JSON sidecar
-    json_url = f"https://sec.gov/Archives/edgar/data/{cik_dir}/{accession_nodash}/index.json"
-    try:
-        j = http_get(json_url, user_agent=user_agent).json()
-        items = j.get("directory", {}).get("item", [])
-        return {"files": [{"name": it.get("name", "")} for it in items]}
-    except Exception:
-        pass  # fall through to HTML
+    hrefs = [m.decode("utf-8", "replace") for m in _HREF_RE.findall(body)]
+    if not hrefs:
+        from bs4 import BeautifulSoup
 
-    # HTML fallback
-    from bs4 import BeautifulSoup
+        soup = BeautifulSoup(body, "lxml")
+        hrefs = [a["href"].split("?")[0].split("#")[0] for a in soup.find_all("a", href=True)]
 
-    candidates = [
-        # canonical index html (many filings expose this)
-        f"https://sec.gov/Archives/edgar/data/{cik_dir}/{accession_nodash}/{accession_nodash[:10]}-{accession_nodash[10:12]}-{accession_nodash[12:]}-index.html",
-        # plain directory listing (what you screenshotted)
-        f"https://sec.gov/Archives/edgar/data/{cik_dir}/{accession_nodash}/",
-    ]
-    for url in candidates:
-        try:
-            html = http_get(url, user_agent=user_agent).text
-            soup = BeautifulSoup(html, "lxml")
-            files = []
-            for a in soup.find_all("a", href=True):
-                name = a["href"].split("/")[-1].split("?")[0]
-                if not name or name in (".", ".."):
-                    continue
-                files.append({"name": name})
-            if files:
-                seen, uniq = set(), []
-                for f in files:
-                    n = f["name"]
-                    if n not in seen:
-                        seen.add(n)
-                        uniq.append(f)
-                return {"files": uniq}
-        except Exception:
+    seen, files = set(), []
+    for href in hrefs:
+        name = href.rpartition("/")[2]
+        if not name or name in (".", "..") or name in seen:
             continue
-    raise HTTPError(f"Could not list files for {cik_dir}/{accession_nodash} via JSON or HTML")
+        seen.add(name)
+        files.append({"name": name})
+    return {"files": files}
 
 
-def find_information_table_filename(listing: dict) -> str | None:
-    files = [f.get("name", "").lower() for f in listing.get("files", [])]
+# Tasks allowed to outlive their caller, e.g. an index.json probe that lost
+# the race but should still populate the cache.
+_BACKGROUND: set[asyncio.Task] = set()
 
-    # Prefer canonical names
-    for n in files:
-        if n.endswith(".xml") and (
-            "informationtable" in n or "infotable" in n or "form13finfo" in n
-        ):
-            return n
 
-    # Fallback: any non-primary_doc XML (the info table is usually not primary_doc.xml)
-    for n in files:
-        if n.endswith(".xml") and n != "primary_doc.xml":
-            return n
+def _reap(task: asyncio.Task) -> None:
+    _BACKGROUND.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        log.debug("Background task failed: %s", task.exception())
 
-    # Last-ditch: if only primary_doc.xml exists, use it (some filers embed the table there)
-    for n in files:
-        if n == "primary_doc.xml":
-            return n
 
-    return None
+def _detach(task: asyncio.Task) -> None:
+    _BACKGROUND.add(task)
+    task.add_done_callback(_reap)
+
+
+async def index_listing_for_accession(
+    session: aiohttp.ClientSession,
+    cik_dir: str,
+    accession_nodash: str,
+) -> dict:
+    """
+    Return a normalized listing dict: {"files": [{"name": "..."} ...]}
+    Races the JSON sidecar, the HTML index page and the directory listing;
+    the first non-empty listing wins (index.json preferred within a short
+    grace window) and the other probes are cancelled.
+    """
+    base = f"https://sec.gov/Archives/edgar/data/{cik_dir}/{accession_nodash}"
+    dashed = f"{accession_nodash[:10]}-{accession_nodash[10:12]}-{accession_nodash[12:]}"
+    index_path = cache.CACHE_DIR / "index" / cik_dir / f"{accession_nodash}.json"
+
+    # A fresh cached index makes the race pointless
+    entry = cache.load(index_path)
+    if entry is not None and cache.is_fresh(entry[1], INDEX_TTL_S):
+        return _listing_from_index_json(orjson.loads(entry[0]))
+
+    async def from_json() -> dict:
+        body = await cached_get_async(session, f"{base}/index.json", index_path, ttl=INDEX_TTL_S)
+        return _listing_from_index_json(orjson.loads(body))
+
+    async def from_html(url: str) -> dict:
+        resp = await http_get_async(session, url)
+        return _listing_from_html(await resp.read())
+
+    json_task = asyncio.ensure_future(from_json())
+    pending = {
+        json_task,
+        # canonical index html (many filings expose this)
+        asyncio.ensure_future(from_html(f"{base}/{dashed}-index.html")),
+        # plain directory listing
+        asyncio.ensure_future(from_html(f"{base}/")),
+    }
+    listing: Optional[dict] = None
+    try:
+        while pending and listing is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                # Retrieve every exception, even after a winner is found;
+                # index.json wins a tie with an HTML page
+                if task.exception() is None and task.result()["files"]:
+                    if listing is None or task is json_task:
+                        listing = task.result()
+        if listing is not None and json_task in pending:
+            # An HTML page won. index.json is what gets cached, so give it a
+            # short grace window and prefer it.
+            pending.discard(json_task)
+            done, _ = await asyncio.wait({json_task}, timeout=INDEX_JSON_GRACE_S)
+            if done and json_task.exception() is None and json_task.result()["files"]:
+                listing = json_task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if not json_task.done():
+            # Still running past the grace window (or we were cancelled during
+            # it): let it finish in the background so the next run hits the cache.
+            _detach(json_task)
+    if listing is None:
+        raise HTTPError(f"Could not list files for {cik_dir}/{accession_nodash} via JSON or HTML")
+    return listing
+
+
+_INFO_TABLE_MARKERS = ("informationtable", "infotable", "form13finfo")
+
+
+def find_information_table_filename(listing: dict) -> str | None:
+    """
+    Pick the information-table file in one pass, by priority:
+    1) an XML with a canonical info-table name,
+    2) any other non-primary_doc XML (the info table is usually not primary_doc.xml),
+    3) primary_doc.xml (some filers embed the table there).
+    """
+    generic: str | None = None
+    primary: str | None = None
+    for f in listing.get("files", []):
+        n = f.get("name", "").lower()
+        if not n.endswith(".xml"):
+            continue
+        if any(m in n for m in _INFO_TABLE_MARKERS):
+            return n
+        if n == "primary_doc.xml":
+            primary = n
+        elif generic is None:
+            generic = n
+    return generic or primary
 
 
 # ---- Fetch information table (try manager CIK, then accession-prefix CIK) ----
 
-def fetch_information_table_xml(
-    cik: str, accession: str, *, user_agent: str | None = None
-) -> str:
+async def fetch_information_table_xml(
+    session: aiohttp.ClientSession, cik: str, accession: str
+) -> bytes:
     """
-    Fetch the 13F information-table XML by trying both possible archive owners:
+    Fetch the 13F information-table XML as raw bytes (left undecoded; the
+    parser honours the XML declaration's encoding). Both possible archive
+    owners are listed concurrently:
     1) reporting manager CIK, then
     2) accession prefix CIK (first 10 digits of accession).
     """
     nodash = accession.replace("-", "")
-    candidates: list[tuple[str, str]] = [(str(int(cik)), nodash)]
+    cik_dirs: list[str] = [str(int(cik))]
     # accession prefix CIK sometimes owns the folder
     try:
         prefix_cik = str(int(accession.split("-")[0]))
-        if prefix_cik not in (c[0] for c in candidates):
-            candidates.append((prefix_cik, nodash))
+        if prefix_cik not in cik_dirs:
+            cik_dirs.append(prefix_cik)
     except Exception:
         pass
 
-    last_err: Optional[Exception] = None
-    for cik_dir, nd in candidates:
-        try:
-            listing = index_listing_for_accession(cik_dir, nd, user_agent=user_agent)
+    # Listings for every owner start together but are consumed in priority
+    # order: once an owner's info table is fetched, the remaining probes are
+    # cancelled rather than awaited.
+    tasks = [
+        asyncio.ensure_future(index_listing_for_accession(session, d, nodash))
+        for d in cik_dirs
+    ]
+    last_err: Optional[BaseException] = None
+    try:
+        for cik_dir, task in zip(cik_dirs, tasks):
+            try:
+                listing = await task
+            except Exception as e:
+                last_err = e
+                continue
             fname = find_information_table_filename(listing)
             if not fname:
                 continue
-            url = f"https://sec.gov/Archives/edgar/data/{cik_dir}/{nd}/{fname}"
-            return http_get(url, user_agent=user_agent).text
-        except Exception as e:
-            last_err = e
-            continue
+            url = f"https://sec.gov/Archives/edgar/data/{cik_dir}/{nodash}/{fname}"
+            try:
+                resp = await http_get_async(session, url)
+                return await resp.read()
+            except Exception as e:
+                last_err = e
+                continue
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     raise HTTPError(
         f"Could not fetch information table for accession {accession}: {last_err}"
-    )
\ No newline at end of file
+    )
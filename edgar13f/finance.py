@@ -1,19 +1,73 @@
 from __future__ import annotations
-from typing import List, Dict
+import functools
+from typing import Callable, List, Dict, Optional, Tuple
 
-def summarize_rows(rows: List[Dict]) -> Dict:
-    total = sum(r.get("value_usd_thousands", 0) for r in rows)
-    rows_sorted = sorted(rows, key=lambda r: r.get("value_usd_thousands", 0), reverse=True)
-    top10 = rows_sorted[:10]
-    top10_sum = sum(r.get("value_usd_thousands", 0) for r in top10)
+import numpy as np
+
+from .parse_13f import Holding
+
+TOP_N = 10
+
+def _summary_numpy(vals: np.ndarray, k: int) -> Tuple[int, np.ndarray, np.ndarray]:
+    total = int(vals.sum())
+    # Partial selection of the top N. Rows tied at the cutoff are taken in
+    # index order, then the N are ordered stably, matching sorted(reverse=True).
+    if k:
+        kth = np.partition(vals, vals.size - k)[vals.size - k]
+        above = np.flatnonzero(vals > kth)
+        ties = np.flatnonzero(vals == kth)[: k - above.size]
+        idx = np.concatenate((above, ties))
+        idx = idx[np.argsort(-vals[idx], kind="stable")]
+    else:
+        idx = np.empty(0, dtype=np.intp)
+    return total, idx, vals[idx] / max(total, 1)
+
+
+def _summary_kernel(vals, k):
+    # Compiled by numba in _jit_kernel(); kept free of Python objects
+    total = vals.sum()
+    idx = np.argsort(-vals, kind="mergesort")[:k]
+    return total, idx, vals[idx] / max(total, 1)
+
+
+@functools.lru_cache(maxsize=1)
+def _jit_kernel() -> Optional[Callable]:
+    """
+    numba-compiled _summary_kernel, or None when numba isn't installed.
+    Imported lazily so single-manager runs never pay for numba; cache=True
+    keeps the compiled kernel on disk across runs.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_summary_kernel)
+
+
+def summarize_rows(rows: List[Holding], *, jit: bool = False) -> Dict:
+    """
+    Headline stats for one filing. jit=True (batch mode) runs the numeric core
+    through a numba kernel when available.
+    """
+    vals = np.fromiter(
+        (r.value_usd_thousands for r in rows), dtype=np.int64, count=len(rows)
+    )
+    k = min(TOP_N, vals.size)
+    kernel = _jit_kernel() if jit else None
+    if kernel is not None:
+        total, idx, weights = kernel(vals, k)
+        total = int(total)
+    else:
+        total, idx, weights = _summary_numpy(vals, k)
+    top10_sum = int(vals[idx].sum())
     total_b = round(total / 1_000_000.0, 3)
     top10_conc = round(top10_sum / total, 4) if total else 0.0
     top_positions = [
         {
-            "issuer": r.get("issuer_name", ""),
-            "value_b": round(r.get("value_usd_thousands", 0)/1_000_000.0, 3),
-            "weight": round(r.get("value_usd_thousands", 0)/total, 4) if total else 0.0,
-        } for r in top10
+            "issuer": rows[i].issuer_name,
+            "value_b": round(int(vals[i])/1_000_000.0, 3),
+            "weight": round(float(w), 4) if total else 0.0,
+        } for i, w in zip(idx.tolist(), weights.tolist())
     ]
     return {
         "num_positions": len(rows),
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
-from typing import List, Dict, Optional
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import aiohttp
 
 from .utils import setup_logging
 from .fetch import (
@@ -10,15 +14,61 @@ from .fetch import (
     load_submissions_json,
     latest_13f_accession,
     fetch_information_table_xml,
+    open_session,
     pad_cik,
 )
-from .parse_13f import iter_info_table_rows
+from .parse_13f import Holding, iter_info_table_rows
 from .finance import summarize_rows
 from .persist import write_csv, write_json
 
 log = logging.getLogger(__name__)
 
 
+# Batch mode: managers processed at once (connections per host are capped
+# separately by the shared session).
+MAX_CONCURRENT_MANAGERS = 5
+
+
+async def run_one(session: aiohttp.ClientSession, raw_cik: str, filing_month: Optional[str], out_csv: str, summary_json: Optional[str], user_agent: Optional[str], *, jit: bool = False) -> None:
+    """
+    Snapshot one manager: submissions -> latest 13F-HR -> info table -> CSV
+    (+ summary). Blocking steps run in worker threads so several managers
+    can share one event loop and HTTP session. jit selects the numba
+    summary kernel, worth its compile cost only across many managers.
+    """
+    submissions = await asyncio.to_thread(load_submissions_json, raw_cik, user_agent=user_agent)
+    latest = latest_13f_accession(submissions, filing_month=filing_month)
+    if not latest:
+        raise LookupError(f"No 13F-HR filings found for CIK {raw_cik} in this period")
+    
+    accession = latest["accession"]
+    manager_name = submissions.get("name", "")
+    period_end = latest["reportDate"]
+    cik_padded = pad_cik(raw_cik)
+    
+    log.info("Latest 13F accession for %s: %s on %s", raw_cik, accession, latest["filingDate"])
+    xml_bytes = await fetch_information_table_xml(session, raw_cik, accession)
+    
+    prefix = {"cik": cik_padded, "manager_name": manager_name, "period_end": period_end}
+    rows: List[Holding] = list(iter_info_table_rows(xml_bytes, prefix))
+    
+    log.info("Parsed %d holdings for %s", len(rows), raw_cik)
+    count = await asyncio.to_thread(write_csv, out_csv, rows)
+    log.info("Wrote CSV: %s (%d rows)", out_csv, count)
+    
+    if summary_json:
+        # Off the event loop: the first jit call compiles or loads the kernel
+        summary = await asyncio.to_thread(summarize_rows, rows, jit=jit)
+        summary.update(prefix)
+        await asyncio.to_thread(write_json, summary_json, summary)
+        log.info("Wrote summary: %s", summary_json)
+
+
+async def _run_single(raw_cik: str, filing_month: Optional[str], out_csv: str, summary_json: Optional[str], user_agent: Optional[str]) -> None:
+    async with open_session(user_agent) as session:
+        await run_one(session, raw_cik, filing_month, out_csv, summary_json, user_agent)
+
+
 def run(manager: Optional[str], cik: Optional[str], filing_month: Optional[str], out_csv: str, summary_json: Optional[str], user_agent: Optional[str]) -> None:
     if not (manager or cik):
         raise SystemExit("Provide either --manager or --cik")
@@ -36,47 +86,55 @@ def run(manager: Optional[str], cik: Optional[str], filing_month: Optional[str],
         log.info("Resolved CIK: %s", raw_cik)
     
     assert raw_cik is not None
-    submissions = load_submissions_json(raw_cik, user_agent=user_agent)
-    latest = latest_13f_accession(submissions, filing_month=filing_month)
-    if not latest:
-        raise SystemExit("No 13F-HR filings found for this manager/period")
-    
-    accession = latest["accession"]
-    manager_name = submissions.get("name", "")
-    # Period-end (reportDate) may be parallel array; best-effort pick
-    period_end = ""
-    recent = submissions.get("filings", {}).get("recent", {})
-    if "reportDate" in recent and isinstance(recent["reportDate"], list) and recent.get("accessionNumber"):
-        # align accession to reportDate by index if possible
-        try:
-            idx = recent.get("accessionNumber", []).index(accession)
-            period_end = recent.get("reportDate", [""] * (idx + 1))[idx]
-        except ValueError:
-            period_end = recent.get("reportDate", [""])[0] if recent.get("reportDate") else ""
-    
-    log.info("Latest 13F accession: %s on %s", accession, latest["filingDate"])
-    xml_text = fetch_information_table_xml(raw_cik, accession, user_agent=user_agent)
-    
-    rows: List[Dict] = []
-    for r in iter_info_table_rows(xml_text):
-        r["cik"] = pad_cik(raw_cik)
-        r["manager_name"] = manager_name
-        r["period_end"] = period_end
-        rows.append(r)
+    try:
+        asyncio.run(_run_single(raw_cik, filing_month, out_csv, summary_json, user_agent))
+    except LookupError as e:
+        raise SystemExit(str(e))
+
+
+async def _run_many(ciks: List[str], filing_month: Optional[str], out_dir: Path, summary_dir: Optional[Path], user_agent: Optional[str]) -> List[Optional[BaseException]]:
+    sem = asyncio.Semaphore(MAX_CONCURRENT_MANAGERS)
     
-    log.info("Parsed %d holdings", len(rows))
-    count = write_csv(out_csv, rows)
-    log.info("Wrote CSV: %s (%d rows)", out_csv, count)
+    async with open_session(user_agent) as session:
+        async def one(c: str) -> None:
+            async with sem:
+                summary_json = str(summary_dir / f"{pad_cik(c)}.json") if summary_dir else None
+                await run_one(session, c, filing_month, str(out_dir / f"{pad_cik(c)}.csv"), summary_json, user_agent, jit=True)
+        
+        return await asyncio.gather(*(one(c) for c in ciks), return_exceptions=True)
+
+
+def run_many(ciks: List[str], filing_month: Optional[str], out_dir: str, summary_dir: Optional[str], user_agent: Optional[str]) -> None:
+    """
+    Snapshot several managers concurrently, writing <out_dir>/<CIK>.csv and,
+    if summary_dir is given, <summary_dir>/<CIK>.json for each.
+    """
+    setup_logging()
     
-    if summary_json:
-        summary = summarize_rows(rows)
-        summary.update({
-            "cik": pad_cik(raw_cik),
-            "manager_name": manager_name,
-            "period_end": period_end,
-        })
-        write_json(summary_json, summary)
-        log.info("Wrote summary: %s", summary_json)
+    # Duplicates (incl. padded vs unpadded) would race on the same output path
+    unique: Dict[str, str] = {}
+    for c in ciks:
+        unique.setdefault(pad_cik(c), c)
+    ciks = list(unique.values())
+    results = asyncio.run(_run_many(
+        ciks, filing_month, Path(out_dir), Path(summary_dir) if summary_dir else None, user_agent
+    ))
+    failed = [(c, r) for c, r in zip(ciks, results) if isinstance(r, BaseException)]
+    for c, err in failed:
+        log.error("CIK %s failed: %s", c, err)
+    if failed:
+        raise SystemExit(f"{len(failed)} of {len(ciks)} managers failed")
+
+
+def read_ciks_file(path: str) -> List[str]:
+    """One CIK per line; blank lines and '#' comments are ignored."""
+    ciks: List[str] = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            c = line.split("#", 1)[0].strip()
+            if c:
+                ciks.append(c)
+    return ciks
 
 
 def main(argv: Optional[List[str]] = None) -> None:
@@ -84,12 +142,16 @@ def main(argv: Optional[List[str]] = None) -> None:
     g = ap.add_mutually_exclusive_group(required=True)
     g.add_argument("--manager", type=str, help="Manager name (e.g., 'Berkshire Hathaway')")
     g.add_argument("--cik", type=str, help="Manager CIK (digits only)")
+    g.add_argument("--ciks-file", type=str, help="File with one manager CIK per line (batch mode)")
     ap.add_argument("--filing-date", type=str, help="YYYY-MM (optional; default latest)")
-    ap.add_argument("--out", type=str, required=True, help="Output CSV path")
-    ap.add_argument("--summary", type=str, help="Optional summary JSON path")
+    ap.add_argument("--out", type=str, required=True, help="Output CSV path (directory with --ciks-file)")
+    ap.add_argument("--summary", type=str, help="Optional summary JSON path (directory with --ciks-file)")
     ap.add_argument("--user-agent", type=str, default=None, help="Custom User-Agent for SEC requests")
     args = ap.parse_args(argv)
     
+    if args.ciks_file:
+        run_many(read_ciks_file(args.ciks_file), args.filing_date, args.out, args.summary, args.user_agent)
+        return
     run(args.manager, args.cik, args.filing_date, args.out, args.summary, args.user_agent)
 
 
@@ -1,58 +1,140 @@
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
-from typing import Dict, Iterator
+import functools
+from io import BytesIO
+from typing import Any, Dict, Iterator, Mapping, NamedTuple, Optional, Tuple
+
+from lxml import etree
 
 NS = {"n": "http://www.sec.gov/edgar/document/thirteenf/informationtable"}
 
-def _get_text(elem: ET.Element | None) -> str:
-    if elem is None or elem.text is None:
-        return ""
-    return elem.text.strip()
+
+class Holding(NamedTuple):
+    """One information-table row; field order matches the CSV columns."""
+    cik: str = ""
+    manager_name: str = ""
+    period_end: str = ""
+    issuer_name: str = ""
+    cusip: str = ""
+    value_usd_thousands: int = 0
+    shares: int = 0
+    share_type: str = ""
+    put_call: str = ""
+    discretion: str = ""
+    voting_sole: int = 0
+    voting_shared: int = 0
+    voting_none: int = 0
+
+
+# Namespaced filings are the norm; bare tags are the legacy fallback.
+_INFO_TABLE_TAGS = ("{%s}infoTable" % NS["n"], "infoTable")
+
+# Direct children of <infoTable> (local name -> output column), and the two
+# nested containers with their own children.
+_DIRECT_FIELDS = {
+    "nameOfIssuer": "issuer_name",
+    "cusip": "cusip",
+    "value": "value_usd_thousands",
+    "putCall": "put_call",
+    "investmentDiscretion": "discretion",
+}
+_NESTED_FIELDS = {
+    "shrsOrPrnAmt": {"sshPrnamt": "shares", "sshPrnamtType": "share_type"},
+    "votingAuthority": {"Sole": "voting_sole", "Shared": "voting_shared", "None": "voting_none"},
+}
+
+_TRANS = str.maketrans("", "", ", \t\n\r\xa0")
+
+
+def _as_int(s: str) -> int:
+    # One translate pass strips separators; the digit check replaces the
+    # try/except so blanks and garbage never raise.
+    t = s.translate(_TRANS)
+    digits = t[1:] if t[:1] == "-" else t
+    return int(t) if digits.isdecimal() else 0
+
+
+# Parsed Holding fields in order, with the converter applied to the raw text
+_FIELDS = (
+    ("issuer_name", None),
+    ("cusip", None),
+    ("value_usd_thousands", _as_int),
+    ("shares", _as_int),
+    ("share_type", None),
+    ("put_call", None),
+    ("discretion", None),
+    ("voting_sole", _as_int),
+    ("voting_shared", _as_int),
+    ("voting_none", _as_int),
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _tag_tables(ns: str) -> Tuple[Dict[str, str], Dict[str, Dict[str, str]]]:
+    """
+    Fully-qualified tag lookups for one namespace ("" for bare tags). A filing
+    never mixes namespaced and bare tags, so this is resolved once per document
+    and rows are matched on the raw tag string with no per-node QName work.
+    """
+    q = (lambda local: "{%s}%s" % (ns, local)) if ns else (lambda local: local)
+    direct = {q(local): key for local, key in _DIRECT_FIELDS.items()}
+    nested = {
+        q(parent): {q(local): key for local, key in children.items()}
+        for parent, children in _NESTED_FIELDS.items()
+    }
+    return direct, nested
+
+
+def _row_from_info(
+    info: etree._Element,
+    head: Tuple[str, str, str],
+    tables: Tuple[Dict[str, str], Dict[str, Dict[str, str]]],
+) -> Holding:
+    direct, nested = tables
+    text: Dict[str, str] = {}
+    for child in info:
+        key = direct.get(child.tag)
+        if key is not None:
+            text.setdefault(key, (child.text or "").strip())
+            continue
+        sub = nested.get(child.tag)
+        if sub is not None:
+            for grandchild in child:
+                key = sub.get(grandchild.tag)
+                if key is not None:
+                    text.setdefault(key, (grandchild.text or "").strip())
+    return Holding(
+        *head,
+        *(conv(text.get(key, "")) if conv else text.get(key, "") for key, conv in _FIELDS),
+    )
 
 
-def iter_info_table_rows(xml_text: str) -> Iterator[Dict]:
+def iter_info_table_rows(
+    xml_bytes: bytes, prefix: Optional[Mapping[str, Any]] = None
+) -> Iterator[Holding]:
+    """
+    Stream <infoTable> rows out of a 13F information table as Holdings. Each
+    element is cleared once read, so memory stays flat regardless of filing
+    size. prefix supplies the per-filing cik/manager_name/period_end.
+    """
+    prefix = prefix or {}
+    head = (prefix.get("cik", ""), prefix.get("manager_name", ""), prefix.get("period_end", ""))
+    context = etree.iterparse(
+        BytesIO(xml_bytes),
+        events=("end",),
+        tag=_INFO_TABLE_TAGS,
+        resolve_entities=False,
+    )
+    tables = None
     try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError as e:
+        for _, info in context:
+            if tables is None:
+                tables = _tag_tables(etree.QName(info).namespace or "")
+            row = _row_from_info(info, head, tables)
+            # Free the finished subtree and any siblings already processed
+            info.clear()
+            while info.getprevious() is not None:
+                del info.getparent()[0]
+            yield row
+    except etree.XMLSyntaxError as e:
         raise ValueError(f"Invalid XML: {e}")
-    
-    nodes = root.findall(".//n:infoTable", NS)
-    if not nodes:
-        nodes = root.findall(".//infoTable")
-    
-    for info in nodes:
-        def f(path: str) -> str:
-            if path.startswith("n:"):
-                return _get_text(info.find(path, NS))
-            return _get_text(info.find(path))
-        
-        issuer = f("n:nameOfIssuer") or f("nameOfIssuer")
-        cusip = f("n:cusip") or f("cusip")
-        value = f("n:value") or f("value")
-        ssh_amt = f("n:shrsOrPrnAmt/n:sshPrnamt") or f("shrsOrPrnAmt/sshPrnamt")
-        ssh_type = f("n:shrsOrPrnAmt/n:sshPrnamtType") or f("shrsOrPrnAmt/sshPrnamtType")
-        put_call = f("n:putCall") or f("putCall")
-        discretion = f("n:investmentDiscretion") or f("investmentDiscretion")
-        v_sole = f("n:votingAuthority/n:Sole") or f("votingAuthority/Sole")
-        v_shared = f("n:votingAuthority/n:Shared") or f("votingAuthority/Shared")
-        v_none = f("n:votingAuthority/n:None") or f("votingAuthority/None")
-        
-        def as_int(s: str) -> int:
-            try:
-                return int(s.replace(",", "").strip())
-            except Exception:
-                return 0
-        
-        yield {
-            "issuer_name": issuer,
-            "cusip": cusip,
-            "value_usd_thousands": as_int(value),
-            "shares": as_int(ssh_amt),
-            "share_type": ssh_type,
-            "put_call": put_call,
-            "discretion": discretion,
-            "voting_sole": as_int(v_sole),
-            "voting_shared": as_int(v_shared),
-            "voting_none": as_int(v_none),
-        }
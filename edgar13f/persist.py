@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import csv
-import json
+from operator import attrgetter
 from typing import Dict, Iterable
 from pathlib import Path
 
+import orjson
 
-def write_csv(path: str, rows: Iterable[Dict]) -> int:
-    rows = list(rows)
+from .parse_13f import Holding
+
+
+def write_csv(path: str, rows: Iterable[Holding]) -> int:
     headers = [
         "cik", "manager_name", "period_end",
         "issuer_name", "cusip", "value_usd_thousands",
@@ -19,13 +22,19 @@ def write_csv(path: str, rows: Iterable[Dict]) -> int:
     if p.parent and not p.parent.exists():
         p.parent.mkdir(parents=True, exist_ok=True)
 
-    with p.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=headers)
-        writer.writeheader()
-        count = 0
-        for r in rows:
-            writer.writerow({k: r.get(k, "") for k in headers})
-            count += 1
+    count = 0
+    get_row = attrgetter(*headers)
+
+    def row_tuple(r: Holding) -> tuple:
+        nonlocal count
+        count += 1
+        return get_row(r)
+
+    # Stream rows straight through; a large buffer keeps write() calls few
+    with p.open("w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(map(row_tuple, rows))
     return count
 
 
@@ -35,5 +44,5 @@ def write_json(path: str, obj: Dict) -> None:
     if p.parent and not p.parent.exists():
         p.parent.mkdir(parents=True, exist_ok=True)
 
-    with p.open("w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2, sort_keys=False)
+    with p.open("wb") as f:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
@@ -1,15 +1,81 @@
+import asyncio
+import functools
 import time
 import logging
-from typing import Dict
+import threading
+import types
+from typing import Mapping
 
 DEFAULT_UA = "JB-13F-Snapshot/0.1 (contact: you@example.com)"
 
-def sec_headers(user_agent: str | None = None) -> Dict[str, str]:
-    return {"User-Agent": user_agent or DEFAULT_UA}
+# Only advertise brotli when a decoder is installed (urllib3 and aiohttp both
+# pick up either package); otherwise a br response would be undecodable.
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "br, gzip, deflate"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = "br, gzip, deflate"
+    except ImportError:
+        ACCEPT_ENCODING = "gzip, deflate"
 
-def polite_sleep(seconds: float = 0.5) -> None:
-    if seconds > 0:
-        time.sleep(seconds)
+@functools.lru_cache(maxsize=4)
+def sec_headers(user_agent: str | None = None) -> Mapping[str, str]:
+    """Request headers for SEC; cached and read-only, so safe to share."""
+    return types.MappingProxyType({
+        "User-Agent": user_agent or DEFAULT_UA,
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "Accept": "application/json, text/xml, text/html;q=0.9, */*;q=0.8",
+    })
+
+class TokenBucket:
+    """
+    Request pacer shared by all callers: bursts of up to `capacity` requests,
+    `rate` requests/second sustained. SEC asks for at most 10 req/s.
+    Thread-safe, and usable from both sync and async code.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._slow_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        if self._slow_until and now >= self._slow_until:
+            self.rate, self._slow_until = self.base_rate, 0.0
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _reserve(self) -> float:
+        # Take a token now (possibly going into debt) and return how long the
+        # caller must wait for it, so waiters queue up fairly.
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1.0
+            return max(0.0, -self._tokens / self.rate)
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def penalize(self, seconds: float = 60.0, min_rate: float = 0.5) -> None:
+        """Halve the rate for `seconds` after the server pushes back (HTTP 429)."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(min_rate, self.rate / 2)
+            self._slow_until = now + seconds
 
 def setup_logging(level: int = logging.INFO) -> None:
     logging.basicConfig(
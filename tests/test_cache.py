@@ -0,0 +1,100 @@
+import asyncio
+
+from edgar13f import cache, fetch
+
+
+def test_store_then_load_roundtrip(tmp_path):
+    path = tmp_path / "submissions" / "0000000001.json"
+    cache.store(path, b'{"name": "X"}', {"ETag": '"abc"', "Last-Modified": "Tue, 01 Jul 2025 00:00:00 GMT"})
+    body, meta = cache.load(path)
+    assert body == b'{"name": "X"}'
+    assert cache.is_fresh(meta, 60)
+    assert not cache.is_fresh(meta, 0)
+    assert cache.conditional_headers(meta) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Tue, 01 Jul 2025 00:00:00 GMT",
+    }
+
+
+def test_load_miss_returns_none(tmp_path):
+    assert cache.load(tmp_path / "missing.json") is None
+
+
+def test_load_rejects_entry_without_validators(tmp_path):
+    path = tmp_path / "legacy.json"
+    path.write_bytes(b'{"name": "X"}')
+    assert cache.load(path) is None
+
+
+class _SyncResp:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+
+def test_cached_get_revalidates_and_reuses_body_on_304(tmp_path, monkeypatch):
+    path = tmp_path / "submissions" / "0000000001.json"
+    sent = []
+    replies = [
+        _SyncResp(200, b'{"v": 1}', {"ETag": '"e1"', "Last-Modified": "Tue, 01 Jul 2025 00:00:00 GMT"}),
+        _SyncResp(304),
+    ]
+
+    def fake_get(url, headers=None, timeout=None):
+        sent.append(dict(headers))
+        return replies.pop(0)
+
+    monkeypatch.setattr(fetch._SESSION, "get", fake_get)
+
+    assert fetch.cached_get("https://data.sec.gov/x.json", path, ttl=60) == b'{"v": 1}'
+    # Within the TTL the network is skipped entirely
+    assert fetch.cached_get("https://data.sec.gov/x.json", path, ttl=60) == b'{"v": 1}'
+    assert len(sent) == 1
+    assert "If-None-Match" not in sent[0]
+
+    _, meta = cache.load(path)
+    meta_before = meta["fetched_at"]
+    assert fetch.cached_get("https://data.sec.gov/x.json", path, ttl=0) == b'{"v": 1}'
+    assert sent[1]["If-None-Match"] == '"e1"'
+    assert sent[1]["If-Modified-Since"] == "Tue, 01 Jul 2025 00:00:00 GMT"
+    body, meta = cache.load(path)
+    assert body == b'{"v": 1}'
+    assert meta["etag"] == '"e1"'
+    assert meta["fetched_at"] >= meta_before
+
+
+class _AsyncResp:
+    def __init__(self, status, body=b"", headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+
+def test_cached_get_async_revalidates_and_reuses_body_on_304(tmp_path, monkeypatch):
+    path = tmp_path / "index" / "1" / "000000000125000001.json"
+    sent = []
+    replies = [_AsyncResp(200, b'{"v": 1}', {"ETag": '"e1"'}), _AsyncResp(304), _AsyncResp(200, b'{"v": 2}')]
+
+    async def fake_get(session, url, headers=None, **kw):
+        sent.append(headers)
+        return replies.pop(0)
+
+    monkeypatch.setattr(fetch, "http_get_async", fake_get)
+
+    async def scenario():
+        first = await fetch.cached_get_async(None, "u", path, ttl=60)
+        cached = await fetch.cached_get_async(None, "u", path, ttl=60)
+        revalidated = await fetch.cached_get_async(None, "u", path, ttl=0)
+        changed = await fetch.cached_get_async(None, "u", path, ttl=0)
+        return first, cached, revalidated, changed
+
+    assert asyncio.run(scenario()) == (b'{"v": 1}', b'{"v": 1}', b'{"v": 1}', b'{"v": 2}')
+    assert sent == [None, {"If-None-Match": '"e1"'}, {"If-None-Match": '"e1"'}]
+    assert cache.load(path)[0] == b'{"v": 2}'
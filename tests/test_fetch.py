@@ -0,0 +1,252 @@
+import asyncio
+
+import pytest
+import requests
+
+from edgar13f import cache, fetch
+from edgar13f.fetch import _listing_from_html, find_information_table_filename, latest_13f_accession
+
+
+def _listing(*names):
+    return {"files": [{"name": n} for n in names]}
+
+
+def test_find_information_table_prefers_canonical_name():
+    listing = _listing("primary_doc.xml", "other.xml", "Form13FInfoTable.xml")
+    assert find_information_table_filename(listing) == "form13finfotable.xml"
+
+
+def test_find_information_table_fallbacks():
+    assert find_information_table_filename(_listing("primary_doc.xml", "a.htm", "b.xml")) == "b.xml"
+    assert find_information_table_filename(_listing("a.htm", "primary_doc.xml")) == "primary_doc.xml"
+    assert find_information_table_filename(_listing("a.htm")) is None
+
+
+def test_latest_13f_accession_aligns_report_date():
+    submissions = {"filings": {"recent": {
+        "form": ["4", "13F-HR", "13F-HR"],
+        "accessionNumber": ["a-0", "a-1", "a-2"],
+        "filingDate": ["2025-08-20", "2025-08-14", "2025-05-15"],
+        "reportDate": ["", "2025-06-30", "2025-03-31"],
+    }}}
+    latest = latest_13f_accession(submissions)
+    assert latest == {"accession": "a-1", "filingDate": "2025-08-14", "reportDate": "2025-06-30", "index": 1}
+    assert latest_13f_accession(submissions, filing_month="2025-05")["reportDate"] == "2025-03-31"
+    assert latest_13f_accession(submissions, filing_month="2024-01") is None
+
+
+def test_listing_from_html_keeps_unique_leaf_names():
+    html = (
+        b'<a href="/Archives/edgar/data/1/000000000125000001/">Parent</a>'
+        b'<A HREF="/Archives/edgar/data/1/000000000125000001/primary_doc.xml">p</A>'
+        b'<a href="infotable.xml?download=1">t</a><a href="infotable.xml">t</a><a href="../">up</a>'
+    )
+    assert _listing_from_html(html) == {"files": [{"name": "primary_doc.xml"}, {"name": "infotable.xml"}]}
+
+
+class _FakeResp:
+    def __init__(self, body):
+        self.status = 200
+        self.headers = {"ETag": '"e"'}
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+
+_ACC = "000000000125000001"
+
+
+def _fake_get(json_gate, html_served=None):
+    # index.json answers once json_gate is set; the directory listing answers
+    # at once (setting html_served) and the -index.html page is missing.
+    async def http_get_async(session, url, **kw):
+        if url.endswith("index.json"):
+            await json_gate.wait()
+            return _FakeResp(b'{"directory": {"item": [{"name": "from-json.xml"}]}}')
+        if url.endswith("-index.html"):
+            raise fetch.HTTPError("404")
+        if html_served is not None:
+            html_served.set()
+        return _FakeResp(b'<a href="from-html.xml">t</a>')
+    return http_get_async
+
+
+def _grace_signal(monkeypatch):
+    # Set once index_listing_for_accession starts its index.json grace wait
+    in_grace = asyncio.Event()
+    real_wait = asyncio.wait
+
+    async def wait(fs, **kw):
+        if kw.get("timeout") is not None:
+            in_grace.set()
+        return await real_wait(fs, **kw)
+
+    monkeypatch.setattr(asyncio, "wait", wait)
+    return in_grace
+
+
+def test_index_listing_prefers_json_within_grace(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(fetch, "INDEX_JSON_GRACE_S", 60)
+
+    async def scenario():
+        # index.json only answers after the HTML listing is already in
+        served = asyncio.Event()
+        monkeypatch.setattr(fetch, "http_get_async", _fake_get(served, served))
+        return await fetch.index_listing_for_accession(None, "1", _ACC)
+
+    assert asyncio.run(scenario()) == {"files": [{"name": "from-json.xml"}]}
+    assert cache.load(tmp_path / "index" / "1" / f"{_ACC}.json") is not None
+
+
+def test_index_listing_slow_json_still_fills_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(fetch, "INDEX_JSON_GRACE_S", 0)
+
+    async def scenario():
+        gate = asyncio.Event()
+        monkeypatch.setattr(fetch, "http_get_async", _fake_get(gate))
+        listing = await fetch.index_listing_for_accession(None, "1", _ACC)
+        assert len(fetch._BACKGROUND) == 1
+        gate.set()
+        await asyncio.gather(*fetch._BACKGROUND)
+        return listing
+
+    assert asyncio.run(scenario()) == {"files": [{"name": "from-html.xml"}]}
+    assert cache.load(tmp_path / "index" / "1" / f"{_ACC}.json") is not None
+
+
+def test_index_listing_cancelled_mid_grace_still_fills_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(fetch, "INDEX_JSON_GRACE_S", 60)
+
+    async def scenario():
+        gate, in_grace = asyncio.Event(), _grace_signal(monkeypatch)
+        monkeypatch.setattr(fetch, "http_get_async", _fake_get(gate))
+        task = asyncio.ensure_future(fetch.index_listing_for_accession(None, "1", _ACC))
+        await in_grace.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # index.json was handed off, not orphaned: it completes and is reaped
+        assert len(fetch._BACKGROUND) == 1
+        gate.set()
+        await asyncio.gather(*fetch._BACKGROUND)
+        assert not fetch._BACKGROUND
+
+    asyncio.run(scenario())
+    assert cache.load(tmp_path / "index" / "1" / f"{_ACC}.json") is not None
+
+
+def test_http_get_does_not_retry_client_errors(monkeypatch):
+    calls = []
+
+    def fake_get(url, **kw):
+        calls.append(url)
+        resp = requests.Response()
+        resp.status_code = 404
+        resp.url = url
+        return resp
+
+    monkeypatch.setattr(fetch._SESSION, "get", fake_get)
+    with pytest.raises(fetch.HTTPError, match="HTTP 404"):
+        fetch.http_get("https://sec.gov/missing")
+    assert calls == ["https://sec.gov/missing"]
+
+
+class _Body:
+    def __init__(self, body):
+        self._body = body
+
+    async def read(self):
+        return self._body
+
+
+def test_fetch_xml_prefers_manager_dir_and_cancels_the_rest(monkeypatch):
+    cancelled = []
+
+    async def fake_listing(session, cik_dir, nodash):
+        if cik_dir == "1649339":
+            return {"files": [{"name": "infotable.xml"}]}
+        try:
+            await asyncio.Event().wait()  # never resolves on its own
+        except asyncio.CancelledError:
+            cancelled.append(cik_dir)
+            raise
+
+    async def fake_get(session, url, **kw):
+        return _Body(url.encode())
+
+    monkeypatch.setattr(fetch, "index_listing_for_accession", fake_listing)
+    monkeypatch.setattr(fetch, "http_get_async", fake_get)
+    xml = asyncio.run(fetch.fetch_information_table_xml(None, "1649339", "0000950123-25-000001"))
+    assert xml == b"https://sec.gov/Archives/edgar/data/1649339/000095012325000001/infotable.xml"
+    assert cancelled == ["950123"]
+
+
+def test_fetch_xml_falls_through_to_accession_prefix_dir(monkeypatch):
+    async def fake_listing(session, cik_dir, nodash):
+        return {"files": [{"name": "infotable.xml"}]}
+
+    async def fake_get(session, url, **kw):
+        if "/1649339/" in url:
+            raise fetch.HTTPError("HTTP 404")
+        return _Body(url.encode())
+
+    monkeypatch.setattr(fetch, "index_listing_for_accession", fake_listing)
+    monkeypatch.setattr(fetch, "http_get_async", fake_get)
+    xml = asyncio.run(fetch.fetch_information_table_xml(None, "1649339", "0000950123-25-000001"))
+    assert xml == b"https://sec.gov/Archives/edgar/data/950123/000095012325000001/infotable.xml"
+
+
+_TICKERS = (
+    b'{"0": {"cik_str": 1, "ticker": "PAPL", "title": "Pineapple Apple Holdings Corp"},'
+    b' "1": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."},'
+    b' "2": {"cik_str": 1067983, "ticker": "BRK-B", "title": "BERKSHIRE HATHAWAY INC"}}'
+)
+
+
+class _Text:
+    def __init__(self, text):
+        self.text = text
+
+
+@pytest.fixture
+def tickers(monkeypatch):
+    atom_urls = []
+
+    def fake_http_get(url, **kw):
+        atom_urls.append(url)
+        return _Text('<link href="/cgi-bin/browse-edgar?action=getcompany&amp;CIK=1649339"/>')
+
+    monkeypatch.setattr(fetch, "cached_get", lambda *a, **kw: _TICKERS)
+    monkeypatch.setattr(fetch, "http_get", fake_http_get)
+    fetch._company_name_index.cache_clear()
+    yield atom_urls
+    fetch._company_name_index.cache_clear()
+
+
+def test_resolve_cik_exact_title(tickers):
+    assert fetch.resolve_cik_from_manager_name("  Berkshire Hathaway Inc ") == "1067983"
+    assert tickers == []
+
+
+def test_resolve_cik_substring_prefers_shortest_title(tickers):
+    assert fetch.resolve_cik_from_manager_name("apple") == "320193"
+    assert fetch.resolve_cik_from_manager_name("Berkshire") == "1067983"
+    assert tickers == []
+
+
+def test_resolve_cik_miss_falls_back_to_atom(tickers):
+    assert fetch.resolve_cik_from_manager_name("Scion Asset Management") == "1649339"
+    assert len(tickers) == 1 and "company=Scion%20Asset%20Management" in tickers[0]
+
+
+def test_resolve_cik_tickers_failure_falls_back_to_atom(tickers, monkeypatch):
+    def failing(*a, **kw):
+        raise fetch.HTTPError("GET company_tickers.json failed")
+
+    monkeypatch.setattr(fetch, "cached_get", failing)
+    assert fetch.resolve_cik_from_manager_name("Apple") == "1649339"
+    assert len(tickers) == 1
@@ -1,12 +1,29 @@
+import pytest
+
 from edgar13f.finance import summarize_rows
+from edgar13f.parse_13f import Holding
 
 def test_summarize_rows_top10():
     rows = [
-        {"issuer_name": "A", "value_usd_thousands": 9000},
-        {"issuer_name": "B", "value_usd_thousands": 1000},
+        Holding(issuer_name="A", value_usd_thousands=9000),
+        Holding(issuer_name="B", value_usd_thousands=1000),
     ]
     s = summarize_rows(rows)
     assert s["num_positions"] == 2
     assert s["sum_value_usd_b"] == 0.01  # 10,000k = $10,000,000 -> 0.01B
     assert round(s["top_10_concentration"], 2) == 0.9
     assert s["top_positions"][0]["issuer"] == "A"
+
+def test_summarize_rows_ties_at_cutoff_keep_earliest_rows():
+    vals = [3, 5, 3, 5, 1, 0, 3, 0, 5, 3, 3, 5, 5, 5, 0, 5, 3, 2, 5, 5, 1, 5, 0, 2, 0, 0, 0, 5]
+    rows = [Holding(issuer_name=str(i), value_usd_thousands=v) for i, v in enumerate(vals)]
+    expected = sorted(range(len(vals)), key=lambda i: vals[i], reverse=True)[:10]
+    s = summarize_rows(rows)
+    assert [p["issuer"] for p in s["top_positions"]] == [str(i) for i in expected]
+
+def test_summarize_rows_jit_matches_numpy_on_ties():
+    # Without numba, jit=True silently takes the NumPy path and proves nothing
+    pytest.importorskip("numba")
+    vals = [3, 5, 3, 5, 1, 0, 3, 0, 5, 3, 3, 5, 5, 5, 0, 5, 3, 2, 5, 5, 1, 5, 0, 2, 0, 0, 0, 5]
+    rows = [Holding(issuer_name=str(i), value_usd_thousands=v) for i, v in enumerate(vals)]
+    assert summarize_rows(rows, jit=True) == summarize_rows(rows)
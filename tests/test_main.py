@@ -0,0 +1,49 @@
+import pytest
+
+from edgar13f import main
+
+
+def test_read_ciks_file_skips_comments_and_blanks(tmp_path):
+    p = tmp_path / "ciks.txt"
+    p.write_text("# managers\n0001649339\n\n  1067983  # Berkshire\n", encoding="utf-8")
+    assert main.read_ciks_file(str(p)) == ["0001649339", "1067983"]
+
+
+def test_run_many_writes_per_cik_and_reports_failures(tmp_path, monkeypatch):
+    calls = []
+
+    async def fake_run_one(session, cik, filing_month, out_csv, summary_json, user_agent, *, jit=False):
+        calls.append((cik, out_csv, summary_json))
+        if cik == "2":
+            raise LookupError("No 13F-HR filings found")
+
+    monkeypatch.setattr(main, "run_one", fake_run_one)
+    with pytest.raises(SystemExit, match="1 of 2 managers failed"):
+        main.run_many(["1", "2", "0000000001"], None, str(tmp_path / "out"), str(tmp_path / "sum"), None)
+
+    assert sorted(calls) == [
+        ("1", str(tmp_path / "out" / "0000000001.csv"), str(tmp_path / "sum" / "0000000001.json")),
+        ("2", str(tmp_path / "out" / "0000000002.csv"), str(tmp_path / "sum" / "0000000002.json")),
+    ]
+
+
+def test_run_many_end_to_end_writes_outputs(tmp_path, monkeypatch):
+    xml = open("tests/data/fixtures/sample_13f.xml", "rb").read()
+    submissions = {"name": "Example LP", "filings": {"recent": {
+        "form": ["13F-HR"],
+        "accessionNumber": ["0000000001-25-000001"],
+        "filingDate": ["2025-08-14"],
+        "reportDate": ["2025-06-30"],
+    }}}
+
+    async def fake_fetch(session, cik, accession):
+        return xml
+
+    monkeypatch.setattr(main, "load_submissions_json", lambda cik, user_agent=None: submissions)
+    monkeypatch.setattr(main, "fetch_information_table_xml", fake_fetch)
+    main.run_many(["1649339"], None, str(tmp_path / "out"), str(tmp_path / "sum"), None)
+
+    csv_lines = (tmp_path / "out" / "0001649339.csv").read_text(encoding="utf-8").splitlines()
+    assert len(csv_lines) == 3
+    assert csv_lines[1].startswith("0001649339,Example LP,2025-06-30,Example Corp A,")
+    assert (tmp_path / "sum" / "0001649339.json").exists()
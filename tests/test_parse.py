@@ -1,13 +1,27 @@
 from edgar13f.parse_13f import iter_info_table_rows
 
 def test_iter_info_table_rows_parses_two():
-    xml = open("tests/data/fixtures/sample_13f.xml", "r", encoding="utf-8").read()
+    xml = open("tests/data/fixtures/sample_13f.xml", "rb").read()
     rows = list(iter_info_table_rows(xml))
     assert len(rows) == 2
     a, b = rows
-    assert a["issuer_name"] == "Example Corp A"
-    assert a["cusip"] == "123456789"
-    assert a["value_usd_thousands"] == 15000
-    assert a["shares"] == 1000000
-    assert a["voting_sole"] == 800000
-    assert b["issuer_name"] == "Example Corp B"
+    assert a.issuer_name == "Example Corp A"
+    assert a.cusip == "123456789"
+    assert a.value_usd_thousands == 15000
+    assert a.shares == 1000000
+    assert a.voting_sole == 800000
+    assert b.issuer_name == "Example Corp B"
+
+def test_iter_info_table_rows_applies_prefix():
+    xml = open("tests/data/fixtures/sample_13f.xml", "rb").read()
+    prefix = {"cik": "0000000001", "manager_name": "Example LP", "period_end": "2025-06-30"}
+    rows = list(iter_info_table_rows(xml, prefix))
+    assert all(r.cik == "0000000001" and r.period_end == "2025-06-30" for r in rows)
+    assert rows[1].cusip == "987654321"
+
+def test_iter_info_table_rows_without_namespace():
+    xml = open("tests/data/fixtures/sample_13f.xml", "rb").read()
+    xml = xml.replace(b' xmlns="http://www.sec.gov/edgar/document/thirteenf/informationtable"', b"")
+    rows = list(iter_info_table_rows(xml))
+    assert [r.value_usd_thousands for r in rows] == [15000, 5000]
+    assert rows[0].voting_shared == 100000
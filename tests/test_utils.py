@@ -0,0 +1,17 @@
+from edgar13f.utils import TokenBucket
+
+
+def test_token_bucket_bursts_then_paces():
+    bucket = TokenBucket(rate=10.0, capacity=2)
+    assert bucket._reserve() == 0.0
+    assert bucket._reserve() == 0.0
+    assert 0.09 < bucket._reserve() <= 0.1
+
+
+def test_token_bucket_penalize_halves_rate():
+    bucket = TokenBucket(rate=8.0, capacity=8)
+    bucket.penalize()
+    assert bucket.rate == 4.0
+    bucket.penalize(seconds=0.0)
+    bucket._reserve()
+    assert bucket.rate == bucket.base_rate